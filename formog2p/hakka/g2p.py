@@ -11,9 +11,9 @@
     print(result)  # ['tʰ-ien_24 k-uŋ_24', 'l-ok_5 s-ui_31']
 """
 
-import json
 import re
 import unicodedata
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -21,9 +21,11 @@ from .word_segment import (
     DIALECTS,
     DialectType,
     PronunciationType,
+    _check_dialect,
+    _cut_cached,
     _get_lexicon,
     _load_english_lexicon,
-    run_jieba,
+    _read_json,
 )
 
 # 模組路徑
@@ -42,23 +44,65 @@ PUNCT_HALF_TO_FULL = {
     ".": "。",
 }
 
+# 全形 ASCII 字元（U+FF01 ~ U+FF5E），NFKC 會將其轉為對應的半形字元
+_RE_FULLWIDTH_ASCII = re.compile("[\uff01-\uff5e]")
+
+
+def _fullwidth_repl(match: re.Match[str]) -> str:
+    """_RE_FULLWIDTH_ASCII 的替換函數（轉為對應的半形字元）。"""
+    return chr(ord(match.group()) - 0xFEE0)
+
+
+# 正規化時保留的字元: 中文字、數字、英文字母、空格、指定標點（，。？！）
+# Unicode 範圍說明:
+#   - \u2e80-\u9fff   : CJK 部首、基本漢字
+#   - \uf900-\ufaff   : CJK 相容漢字
+#   - \U00020000-\U000323af : CJK 擴展 B ~ H（臺客語常用外字）
+#   - \ue000-\uf8ff   : 私用區 (PUA)
+#   - \U000f0000-\U0010fffd : 私用區補充 A & B（臺客語造字）
+_KEEP_CHARS = (
+    r"\u2e80-\u9fff"
+    r"\uf900-\ufaff"
+    r"\U00020000-\U000323af"
+    r"\ue000-\uf8ff"
+    r"\U000f0000-\U0010fffd"
+    r"a-zA-Z0-9\s，。？！"
+)
+
+# 不需要的標點和特殊字元（模組載入時編譯一次）
+_RE_UNWANTED = re.compile(rf"[^{_KEEP_CHARS}]")
+
+# 連續空白
+_RE_WHITESPACE = re.compile(r"\s+")
+
 # 異體字對照表（延遲載入）
 _variant_map: dict[str, str] | None = None
 
+# 比對所有異體字的正則表達式（隨 _variant_map 一起建立，空對照表時為 None）
+_variant_pattern: re.Pattern[str] | None = None
+
 
 def _load_variant_map() -> dict[str, str]:
     """載入異體字對照表。"""
-    global _variant_map
+    global _variant_map, _variant_pattern
     if _variant_map is None:
         variant_map_path = SHARE_DIR / "variant_map.json"
         if variant_map_path.exists():
-            with open(variant_map_path, "r", encoding="utf-8") as f:
-                _variant_map = json.load(f)
+            _variant_map = _read_json(variant_map_path)
         else:
             _variant_map = {}
+        # 對照表以單字為單位，只取單一字元的 key 組成字元集合
+        chars = "".join(re.escape(char) for char in _variant_map if len(char) == 1)
+        if chars:
+            _variant_pattern = re.compile(f"[{chars}]")
     return _variant_map
 
 
+def _variant_repl(match: re.Match[str]) -> str:
+    """_variant_pattern 的替換函數。"""
+    return _variant_map[match.group()]
+
+
 def apply_variant_map(text: str) -> str:
     """
     套用異體字對照表，將異體字轉換為標準字。
@@ -75,15 +119,12 @@ def apply_variant_map(text: str) -> str:
         >>> apply_variant_map("温泉")
         '溫泉'
     """
-    variant_map = _load_variant_map()
-    if not variant_map:
+    _load_variant_map()
+    if _variant_pattern is None:
         return text
 
-    # 逐字替換
-    result = []
-    for char in text:
-        result.append(variant_map.get(char, char))
-    return "".join(result)
+    # 只針對出現的異體字呼叫替換函數，其餘字元由正則引擎直接略過
+    return _variant_pattern.sub(_variant_repl, text)
 
 
 def normalize(
@@ -120,33 +161,21 @@ def normalize(
         'HELLO WORLD'
     """
     # 1. Unicode NFKC 正規化（全形轉半形、相容字元轉換）
+    # 先直接將全形標點、英數轉為半形（結果與 NFKC 相同），一般客語文字
+    # 便已是 NFKC 形式，unicodedata.normalize 可以直接回傳而不必重組整個字串
+    text = _RE_FULLWIDTH_ASCII.sub(_fullwidth_repl, text)
     text = unicodedata.normalize("NFKC", text)
 
     # 2. 半形標點轉全形標點
+    # 註: 對中文文字而言，逐一 str.replace 比 str.translate 快得多
     for half, full in PUNCT_HALF_TO_FULL.items():
         text = text.replace(half, full)
 
     # 3. 移除不需要的標點和特殊字元
-    # 保留: 中文字、數字、英文字母、空格、指定標點（，。？！）
-    # Unicode 範圍說明:
-    #   - \u2e80-\u9fff   : CJK 部首、基本漢字
-    #   - \uf900-\ufaff   : CJK 相容漢字
-    #   - \U00020000-\U000323af : CJK 擴展 B ~ H（臺客語常用外字）
-    #   - \ue000-\uf8ff   : 私用區 (PUA)
-    #   - \U000f0000-\U0010fffd : 私用區補充 A & B（臺客語造字）
-    pattern = (
-        r"[^"
-        r"\u2e80-\u9fff"
-        r"\uf900-\ufaff"
-        r"\U00020000-\U000323af"
-        r"\ue000-\uf8ff"
-        r"\U000f0000-\U0010fffd"
-        r"a-zA-Z0-9\s，。？！]"
-    )
-    text = re.sub(pattern, "", text)
+    text = _RE_UNWANTED.sub("", text)
 
     # 4. 移除多餘空白（多個空白合併為一個）
-    text = re.sub(r"\s+", " ", text)
+    text = _RE_WHITESPACE.sub(" ", text)
 
     # 5. 去除頭尾空白
     text = text.strip()
@@ -186,64 +215,21 @@ class G2PResult:
         return " ".join(self.pronunciations)
 
 
-def g2p(
-    text: str,
-    dialect: DialectType = "客語_四縣",
-    pronunciation_type: PronunciationType = "ipa",
-    unknown_token: str | None = None,
-    keep_unknown: bool = True,
-    use_variant_map: bool = True,
-    include_english: bool = False,
-) -> G2PResult:
+def _get_lexicons(
+    dialect: str, pronunciation_type: PronunciationType, include_english: bool
+) -> tuple[dict[str, list[str]], dict[str, list[str]] | None]:
     """
-    將文字轉換為發音序列 (Grapheme-to-Phoneme)。
-
-    流程:
-        1. 正規化文字 (normalize)，包含異體字轉換
-        2. 如果包含英文，將文本轉為大寫
-        3. 使用 Jieba 斷詞
-        4. 查詢每個詞的發音（取列表中的第一個）
-        5. 標點符號（，。？！）視為 known token，直接作為發音
-        6. 如果是英文詞彙且 pronunciation_type 為 ipa，查詢英文詞典
-        7. 回傳 G2PResult（包含發音序列與未知詞彙）
+    取得 G2P 查詢發音所需的詞典。
 
     Args:
-        text: 輸入文字
-        dialect: 腔調名稱，預設為「客語_四縣」
-        pronunciation_type: 發音格式 ("ipa" 或 "pinyin")
-        unknown_token: 未知詞彙的替代符號，若為 None 則使用原詞
-        keep_unknown: 是否保留未知詞彙，若為 False 則跳過
-        use_variant_map: 是否套用異體字對照表，預設為 True
-        include_english: 是否包含英文發音（僅支援 ipa），預設為 False
+        dialect: 腔調名稱
+        pronunciation_type: 發音格式
+        include_english: 是否包含英文發音
 
     Returns:
-        G2PResult 物件，包含:
-            - pronunciations: 發音序列
-            - unknown_words: 未知詞彙列表
-            - details: 詳細的詞彙與發音對應
-            - has_unknown: 是否有未知詞彙
-
-    Example:
-        >>> result = g2p("天公落水", "客語_四縣", "ipa")
-        >>> result.pronunciations
-        ['tʰ-ien_24 k-uŋ_24', 'l-ok_5 s-ui_31']
-
-        >>> result = g2p("天公落水HELLO", "客語_四縣", "ipa", include_english=True)
-        >>> result.pronunciations
-        ['tʰ-ien_24 k-uŋ_24', 'l-ok_5 s-ui_31', 'h ə l oʊ']
+        (客語詞典, 英文詞典)；英文詞典僅在包含英文且發音格式為 ipa 時載入，否則為 None
     """
-    # 1. 正規化（包含異體字轉換，以及英文大寫轉換）
-    normalized_text = normalize(
-        text, use_variant_map=use_variant_map, include_english=include_english
-    )
-
-    if not normalized_text:
-        return G2PResult()
-
-    # 2. 斷詞
-    words = run_jieba(normalized_text, dialect, include_english=include_english)
-
-    # 3. 載入詞典
+    _check_dialect(dialect)
     lexicon = _get_lexicon(dialect, pronunciation_type)
 
     # 如果包含英文且發音類型是 ipa，載入英文詞典
@@ -251,7 +237,29 @@ def g2p(
     if include_english and pronunciation_type == "ipa":
         english_lexicon = _load_english_lexicon()
 
-    # 4. 查詢發音
+    return lexicon, english_lexicon
+
+
+def _lookup_words(
+    words: Iterable[str],
+    lexicon: dict[str, list[str]],
+    english_lexicon: dict[str, list[str]] | None,
+    unknown_token: str | None,
+    keep_unknown: bool,
+) -> G2PResult:
+    """
+    查詢斷詞結果中每個詞的發音。
+
+    Args:
+        words: 斷詞結果
+        lexicon: 客語詞典
+        english_lexicon: 英文詞典（不查詢英文時為 None）
+        unknown_token: 未知詞彙的替代符號，若為 None 則使用原詞
+        keep_unknown: 是否保留未知詞彙
+
+    Returns:
+        G2PResult 物件
+    """
     pronunciations: list[str] = []
     unknown_words: list[str] = []
     details: list[dict[str, str | None]] = []
@@ -299,6 +307,72 @@ def g2p(
     )
 
 
+def g2p(
+    text: str,
+    dialect: DialectType = "客語_四縣",
+    pronunciation_type: PronunciationType = "ipa",
+    unknown_token: str | None = None,
+    keep_unknown: bool = True,
+    use_variant_map: bool = True,
+    include_english: bool = False,
+) -> G2PResult:
+    """
+    將文字轉換為發音序列 (Grapheme-to-Phoneme)。
+
+    流程:
+        1. 正規化文字 (normalize)，包含異體字轉換
+        2. 如果包含英文，將文本轉為大寫
+        3. 使用 Jieba 斷詞
+        4. 查詢每個詞的發音（取列表中的第一個）
+        5. 標點符號（，。？！）視為 known token，直接作為發音
+        6. 如果是英文詞彙且 pronunciation_type 為 ipa，查詢英文詞典
+        7. 回傳 G2PResult（包含發音序列與未知詞彙）
+
+    Args:
+        text: 輸入文字
+        dialect: 腔調名稱，預設為「客語_四縣」
+        pronunciation_type: 發音格式 ("ipa" 或 "pinyin")
+        unknown_token: 未知詞彙的替代符號，若為 None 則使用原詞
+        keep_unknown: 是否保留未知詞彙，若為 False 則跳過
+        use_variant_map: 是否套用異體字對照表，預設為 True
+        include_english: 是否包含英文發音（僅支援 ipa），預設為 False
+
+    Returns:
+        G2PResult 物件，包含:
+            - pronunciations: 發音序列
+            - unknown_words: 未知詞彙列表
+            - details: 詳細的詞彙與發音對應
+            - has_unknown: 是否有未知詞彙
+
+    Example:
+        >>> result = g2p("天公落水", "客語_四縣", "ipa")
+        >>> result.pronunciations
+        ['tʰ-ien_24 k-uŋ_24', 'l-ok_5 s-ui_31']
+
+        >>> result = g2p("天公落水HELLO", "客語_四縣", "ipa", include_english=True)
+        >>> result.pronunciations
+        ['tʰ-ien_24 k-uŋ_24', 'l-ok_5 s-ui_31', 'h ə l oʊ']
+    """
+    # 1. 正規化（包含異體字轉換，以及英文大寫轉換）
+    normalized_text = normalize(
+        text, use_variant_map=use_variant_map, include_english=include_english
+    )
+
+    if not normalized_text:
+        return G2PResult()
+
+    # 2. 載入詞典（先於斷詞載入，讓 Tokenizer 沿用同一份詞彙）
+    lexicon, english_lexicon = _get_lexicons(
+        dialect, pronunciation_type, include_english
+    )
+
+    # 3. 斷詞（直接使用快取的斷詞結果，不另外複製成 list）
+    words = _cut_cached(normalized_text, dialect, include_english)
+
+    # 4. 查詢發音
+    return _lookup_words(words, lexicon, english_lexicon, unknown_token, keep_unknown)
+
+
 def g2p_simple(
     text: str,
     dialect: DialectType = "客語_四縣",
@@ -412,18 +486,28 @@ def batch_g2p(
         >>> for r in results:
         ...     print(r.pronunciations)
     """
-    return [
-        g2p(
-            text,
-            dialect,
-            pronunciation_type,
-            unknown_token,
-            keep_unknown,
-            use_variant_map,
-            include_english,
+    # 詞典只在遇到第一個非空文字時取得一次，之後所有文字共用
+    # （與 g2p() 相同，正規化後為空的文字不會載入詞典或檢查腔調）
+    lexicons = None
+
+    results = []
+    for text in texts:
+        normalized_text = normalize(
+            text, use_variant_map=use_variant_map, include_english=include_english
         )
-        for text in texts
-    ]
+        if not normalized_text:
+            results.append(G2PResult())
+            continue
+
+        if lexicons is None:
+            lexicons = _get_lexicons(dialect, pronunciation_type, include_english)
+        lexicon, english_lexicon = lexicons
+
+        words = _cut_cached(normalized_text, dialect, include_english)
+        results.append(
+            _lookup_words(words, lexicon, english_lexicon, unknown_token, keep_unknown)
+        )
+    return results
 
 
 # =============================================================================
@@ -1,8 +1,11 @@
 """G2P 功能測試"""
 
+import pytest
+
 from formog2p.hakka import (
     G2PResult,
     apply_variant_map,
+    batch_g2p,
     g2p,
     g2p_simple,
     g2p_string,
@@ -19,6 +22,14 @@ class TestNormalize:
         assert "？" in normalize("Hello?")
         assert "！" in normalize("Hello!")
 
+    def test_full_width_ascii(self):
+        """測試全形英數與標點轉換（與 NFKC 結果一致）"""
+        assert normalize("ＡＢＣ１２３？") == "ABC123？"
+        assert normalize("天公落水！") == "天公落水！"
+        assert normalize("Ｈｅｌｌｏ", include_english=True) == "HELLO"
+        # 全形範圍的兩端（U+FF01「！」、U+FF5E「～」）
+        assert normalize("！～ａｚ") == "！az"
+
     def test_variant_map(self):
         """測試異體字轉換"""
         result = normalize("台灣")
@@ -48,6 +59,13 @@ class TestG2P:
         assert isinstance(result, G2PResult)
         assert len(result.pronunciations) > 0
 
+    def test_pinyin_g2p(self):
+        """測試拼音 G2P 轉換"""
+        ipa = g2p("天公落水", "客語_四縣", "ipa")
+        pinyin = g2p("天公落水", "客語_四縣", "pinyin")
+        assert not pinyin.has_unknown
+        assert len(pinyin.pronunciations) == len(ipa.pronunciations)
+
     def test_g2p_with_punctuation(self):
         """測試含標點的 G2P"""
         result = g2p("天公！", "客語_四縣", "ipa")
@@ -59,6 +77,11 @@ class TestG2P:
         assert result.has_unknown
         assert len(result.unknown_words) > 0
 
+    def test_g2p_invalid_dialect(self):
+        """測試不支援的腔調"""
+        with pytest.raises(ValueError):
+            g2p("天公", "客語_不存在", "ipa")
+
     def test_g2p_all_dialects(self):
         """測試所有腔調"""
         from formog2p.hakka import DIALECTS
@@ -84,3 +107,25 @@ class TestG2PString:
         """測試回傳字串"""
         result = g2p_string("天公", "客語_四縣", "ipa")
         assert isinstance(result, str)
+
+
+class TestBatchG2P:
+    """批次 G2P 測試"""
+
+    def test_matches_g2p(self):
+        """測試批次結果與逐一呼叫 g2p 相同"""
+        texts = ["天公落水！", "", "XYZ未知詞"]
+        results = batch_g2p(texts, "客語_四縣", "ipa")
+        assert results == [g2p(text, "客語_四縣", "ipa") for text in texts]
+
+        # 正規化後為空的文字不會檢查腔調（與 g2p 相同）
+        assert batch_g2p([], "客語_不存在") == []
+        texts = ["", "@@ "]
+        results = batch_g2p(texts, "客語_不存在", "ipa")
+        assert results == [g2p(text, "客語_不存在", "ipa") for text in texts]
+        assert results == [G2PResult(), G2PResult()]
+
+    def test_invalid_dialect(self):
+        """測試含非空文字時，不支援的腔調仍會拋出 ValueError"""
+        with pytest.raises(ValueError):
+            batch_g2p(["", "天公"], "客語_不存在", "ipa")
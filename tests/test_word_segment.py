@@ -1,15 +1,23 @@
 """斷詞功能測試"""
 
+import jieba
+import pytest
+
+import formog2p.hakka.word_segment as word_segment
 from formog2p.hakka import (
     DIALECTS,
+    clear_tokenizer_cache,
     english_word_exists,
     find_unknown_words,
+    get_cached_tokenizers,
     get_english_pronunciation,
     get_lexicon_stats,
     get_pronunciation,
     run_jieba,
     word_exists,
+    word_exists_in_dialects,
 )
+from formog2p.hakka.word_segment import _add_words, _get_lexicon, _word_sets
 
 
 class TestRunJieba:
@@ -27,6 +35,41 @@ class TestRunJieba:
             words = run_jieba("天公", dialect)
             assert isinstance(words, list)
 
+    def test_cached_result_not_shared(self):
+        """測試快取的斷詞結果不會被呼叫端修改"""
+        words = run_jieba("天公落水", "客語_四縣")
+        expected = list(words)
+        words.append("XYZ")
+        assert run_jieba("天公落水", "客語_四縣") == expected
+
+
+class TestAddWords:
+    """批次加入詞彙測試"""
+
+    @staticmethod
+    def _make_tokenizer() -> jieba.Tokenizer:
+        """建立含少量既有詞彙的 Tokenizer（不載入 Jieba 預設字典）"""
+        tokenizer = jieba.Tokenizer()
+        tokenizer.FREQ = {"天": 5, "天公": 0, "落": 3}
+        tokenizer.total = 8
+        tokenizer.initialized = True
+        return tokenizer
+
+    def test_matches_add_word(self):
+        """測試與逐一呼叫 add_word 的結果相同"""
+        # 「天公落水」先於其前綴「天公」「天」加入，「落水」的前綴「落」已存在
+        words = ["天公落水", "天公", "落水", "天", "ABC"]
+
+        expected = self._make_tokenizer()
+        for word in words:
+            expected.add_word(word, freq=len(word) * 10000)
+
+        actual = self._make_tokenizer()
+        _add_words(actual, words)
+
+        assert actual.FREQ == expected.FREQ
+        assert actual.total == expected.total
+
 
 class TestGetPronunciation:
     """發音查詢測試"""
@@ -55,6 +98,31 @@ class TestWordExists:
         """測試不存在的詞彙"""
         assert word_exists("XYZABC", "客語_四縣") is False
 
+    def test_word_set_agrees_with_lexicon(self):
+        """測試詞彙集合快取建立後，結果仍與詞典一致"""
+        lexicon = _get_lexicon("客語_四縣", "ipa")
+        word_exists("天公", "客語_四縣")
+        assert "客語_四縣" in _word_sets
+
+        words = list(lexicon)[:50] + ["XYZABC", "未知詞彙"]
+        for word in words:
+            assert word_exists(word, "客語_四縣") is (word in lexicon)
+
+        unknown = find_unknown_words("天公落水XYZ", "客語_四縣")
+        assert unknown == [
+            w for w in run_jieba("天公落水XYZ", "客語_四縣") if w not in lexicon
+        ]
+
+    def test_word_exists_in_dialects_no_word_sets(self):
+        """測試跨腔調查詢不會為各腔調建立詞彙集合"""
+        clear_tokenizer_cache()
+        assert not _word_sets
+
+        results = word_exists_in_dialects("天公")
+        assert set(results) == set(DIALECTS)
+        assert results["客語_四縣"] is True
+        assert not _word_sets
+
 
 class TestEnglish:
     """英文相關功能測試"""
@@ -88,3 +156,26 @@ class TestFindUnknownWords:
         """測試找出未知詞彙"""
         unknown = find_unknown_words("天公XYZ", "客語_四縣")
         assert isinstance(unknown, list)
+
+    def test_find_unknown_invalid_dialect(self):
+        """測試不支援的腔調"""
+        with pytest.raises(ValueError):
+            find_unknown_words("天公", "客語_不存在")
+
+
+class TestClearTokenizerCache:
+    """快取清除測試"""
+
+    def test_releases_all_caches(self):
+        """測試清除後會釋放 Tokenizer 相關的所有快取"""
+        run_jieba("天公落水", "客語_四縣")
+        word_exists("天公", "客語_四縣")
+        assert word_segment._default_freq is not None
+
+        clear_tokenizer_cache()
+        assert get_cached_tokenizers() == []
+        assert not _word_sets
+        assert word_segment._default_freq is None
+
+        # 清除後仍可重新建立
+        assert run_jieba("天公落水", "客語_四縣")